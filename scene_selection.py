@@ -4,13 +4,48 @@ Simple Frame Organizer - Organize extracted frames into a table with timestamps
 """
 
 import os
+import io
+import re
+import base64
+import numpy as np
 import pandas as pd
 from pathlib import Path
 import subprocess
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:
+    pa = None
 
-def organize_frames_table(video_path: str, fps: float = 2, scene_threshold: float = 0.3) -> dict:
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+
+# Matches one frame entry of ffmpeg's metadata=mode=print output:
+# the "frame:... pts_time:T" line followed by its "lavfi.scene_score=S" line
+_SCENE_RE = re.compile(r'pts_time:(\d+\.?\d*).*?scene_score=(\d+\.?\d*)', re.DOTALL)
+
+# One row of the HTML frame table, filled in by create_html_table
+_HTML_ROW_TEMPLATE = """
+        <tr>
+            <td>{ts}</td>
+            <td><img src="{src}" class="frame-image" alt="Frame at {ts}"></td>
+            <td class="centered"><input type="checkbox" class="frame-checkbox" data-timestamp="{ts}" data-frame="{ff}"></td>
+        </tr>
+"""
+
+# Size of the thumbnails inlined into portable HTML tables, matching the .frame-image CSS
+THUMBNAIL_SIZE = (120, 90)
+
+
+def organize_frames_table(video_path: str, fps: float = 2, scene_threshold: float = 0.3,
+                          save_frames: bool = True, portable: bool = False) -> dict:
     """
     Organize extracted frames into a table with timestamps and scene information.
     Similar to duckduckgo_search but for frame organization.
@@ -19,6 +54,10 @@ def organize_frames_table(video_path: str, fps: float = 2, scene_threshold: floa
         video_path: Path to the video file
         fps: Frames per second to extract
         scene_threshold: Scene change detection threshold
+        save_frames: Write the extracted JPEGs to the frames directory. When False,
+            frames are kept in memory only and inlined into the HTML table.
+        portable: Inline small thumbnails into the HTML table so it is a single
+            self-contained file
         
     Returns:
         Dictionary containing organization results
@@ -36,66 +75,31 @@ def organize_frames_table(video_path: str, fps: float = 2, scene_threshold: floa
         
         print(f"🎬 Organizing frames for: {video_path}")
         
-        # Extract frames
-        print("📸 Extracting frames...")
-        os.makedirs(output_dir, exist_ok=True)
-        
-        cmd = [
-            "ffmpeg", "-i", video_path,
-            "-vf", f"fps={fps}",
-            "-f", "image2",
-            f"{output_dir}/frame_%04d.jpg"
-        ]
-        
-        subprocess.run(cmd, capture_output=True, check=True)
-        
-        # Get frame files and calculate timestamps
-        frame_files = sorted([f for f in os.listdir(output_dir) if f.endswith('.jpg')])
-        frames_data = []
+        # Extract frames and detect scene changes in a single decode pass
+        print("📸 Extracting frames and detecting scene changes...")
+        frames, scene_changes = extract_frames_and_detect_scenes(video_path, fps, scene_threshold)
         
-        for i, frame_file in enumerate(frame_files):
-            timestamp = i / fps
-            frame_path = os.path.join(output_dir, frame_file)
-            
-            frames_data.append({
-                "Timestamp": format_timestamp(timestamp),
-                "Time (seconds)": round(timestamp, 2),
-                "Frame Number": i + 1,
-                "Frame File": frame_file,
-                "Frame Path": frame_path
-            })
+        # Name frames the same way ffmpeg's frame_%04d.jpg pattern would
+        frame_files = [f"frame_{i + 1:04d}.jpg" for i in range(len(frames))]
+        frame_paths = [os.path.join(output_dir, frame_file) for frame_file in frame_files]
         
-        # Detect scene changes
-        print("🎭 Detecting scene changes...")
-        scene_changes = detect_scene_changes(video_path, scene_threshold)
+        # Create DataFrame with timestamps and scene information
+        df = build_frame_table(frame_files, frame_paths, fps, scene_changes)
         
-        # Add scene information to frames
-        for frame in frames_data:
-            frame_time = frame["Time (seconds)"]
-            scene_number = 1
-            scene_score = 0.0
-            
-            for scene in scene_changes:
-                if frame_time >= scene["timestamp"]:
-                    scene_number += 1
-                    scene_score = scene["scene_score"]
-                else:
-                    break
-            
-            frame["Scene Number"] = scene_number
-            frame["Scene Score"] = scene_score
-        
-        # Create DataFrame
-        df = pd.DataFrame(frames_data)
-        
-        # Save to CSV
+        # Write frames, CSV and HTML table concurrently, they do not depend on each other
         csv_path = f"{video_name}_frame_table.csv"
-        df.to_csv(csv_path, index=False)
-        print(f"📊 Frame table saved to: {csv_path}")
-        
-        # Create HTML table
         html_path = f"{video_name}_frame_table.html"
-        create_html_table(df, html_path, video_name)
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            writes = [
+                executor.submit(write_frame_table_csv, df, csv_path),
+                executor.submit(create_html_table, df, html_path, video_name,
+                                frames if portable or not save_frames else None, portable)
+            ]
+            if save_frames:
+                writes.append(executor.submit(write_frames, output_dir, frame_paths, frames))
+            for future in writes:
+                future.result()
+        print(f"📊 Frame table saved to: {csv_path}")
         
         return {
             "status": "success",
@@ -105,7 +109,7 @@ def organize_frames_table(video_path: str, fps: float = 2, scene_threshold: floa
             "dataframe": df,
             "csv_file": csv_path,
             "html_file": html_path,
-            "frames_directory": output_dir
+            "frames_directory": output_dir if save_frames else None
         }
         
     except Exception as e:
@@ -115,62 +119,250 @@ def organize_frames_table(video_path: str, fps: float = 2, scene_threshold: floa
         }
 
 
+def extract_frames_and_detect_scenes(video_path: str, fps: float = 2,
+                                     threshold: float = 0.3) -> tuple:
+    """
+    Extract frames and detect scene changes with a single ffmpeg invocation.
+    
+    The decoded stream is split in the filtergraph so the video is only
+    decoded once: one branch feeds the fps sampler, piped to stdout as an
+    MJPEG stream, the other feeds the scene detector.
+    
+    Args:
+        video_path: Path to the video file
+        fps: Frames per second to extract
+        threshold: Scene change detection threshold
+        
+    Returns:
+        Tuple of (list of JPEG bytes, list of scene change dicts with
+        "timestamp" and "scene_score")
+    """
+    # The path is pasted into the filtergraph, so it must not come from the video
+    # name: mkstemp's random names in the working directory need no escaping
+    fd, temp_file = tempfile.mkstemp(prefix="temp_scene_detection_", suffix=".txt", dir=".")
+    os.close(fd)
+    temp_file = os.path.basename(temp_file)
+    
+    cmd = [
+        "ffmpeg", "-nostats", "-loglevel", "error", "-i", video_path,
+        "-filter_complex",
+        f"[0:v]split=2[v1][v2];"
+        f"[v1]fps={fps}[frames];"
+        f"[v2]select='gt(scene,{threshold})',metadata=mode=print:file={temp_file}[scenes]",
+        "-map", "[frames]", "-f", "image2pipe", "-vcodec", "mjpeg", "pipe:1",
+        "-map", "[scenes]", "-f", "null", "-"
+    ]
+    
+    try:
+        # Only stdout carries data; ffmpeg's log output is discarded rather than buffered.
+        # Frames are split off as the stream arrives, so the whole MJPEG stream is
+        # never held in memory next to the frames cut from it
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+        try:
+            frames = split_jpeg_stream(proc.stdout)
+        except BaseException:
+            proc.terminate()
+            raise
+        finally:
+            proc.stdout.close()
+            proc.wait()
+        if proc.returncode != 0:
+            raise subprocess.CalledProcessError(proc.returncode, cmd)
+        
+        with open(temp_file, "r") as f:
+            return frames, parse_scene_changes(f.read())
+    finally:
+        # Clean up temporary file
+        if os.path.exists(temp_file):
+            os.remove(temp_file)
+
+
+def split_jpeg_stream(stream, chunk_size: int = 1 << 20) -> list:
+    """
+    Split a concatenated MJPEG stream into JPEG images on the SOI/EOI markers.
+    
+    The stream is read chunk by chunk and only the incomplete trailing image is
+    buffered, so memory stays at roughly the size of the images returned.
+    """
+    images = []
+    buf = bytearray()
+    scan = 0  # where to resume looking for the EOI marker of the current image
+    for chunk in iter(lambda: stream.read(chunk_size), b''):
+        buf += chunk
+        while True:
+            start = buf.find(b'\xff\xd8')
+            if start == -1:
+                del buf[:-1]  # keep a possible first half of a marker
+                scan = 0
+                break
+            end = buf.find(b'\xff\xd9', max(start + 2, scan))
+            if end == -1:
+                scan = len(buf) - 1
+                break
+            images.append(bytes(buf[start:end + 2]))
+            del buf[:end + 2]
+            scan = 0
+    return images
+
+
 def detect_scene_changes(video_path: str, threshold: float = 0.3) -> list:
     """Detect scene changes in the video"""
     
-    # Create temporary file for scene detection
-    temp_file = "temp_scene_detection.txt"
-    with open(temp_file, "w") as f:
-        pass
-    
+    # file=- makes the metadata filter print to stdout; the null muxer writes nothing there
     cmd = [
-        "ffmpeg", "-i", video_path,
-        "-vf", f"select='gt(scene,{threshold})',metadata=mode=print:file={temp_file}",
+        "ffmpeg", "-nostats", "-loglevel", "error", "-i", video_path,
+        "-vf", f"select='gt(scene,{threshold})',metadata=mode=print:file=-",
         "-f", "null", "-"
     ]
     
-    subprocess.run(cmd, capture_output=True, check=True)
+    result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, check=True)
     
     # Parse scene changes
-    scene_changes = []
-    with open(temp_file, "r") as f:
-        content = f.read()
+    return parse_scene_changes(result.stdout.decode())
+
+
+def parse_scene_changes(content: str) -> list:
+    """Parse the output of ffmpeg's metadata=mode=print filter into scene change dicts"""
+    return [
+        {"timestamp": float(m[1]), "scene_score": float(m[2])}
+        for m in _SCENE_RE.finditer(content)
+    ]
+
+
+def build_frame_table(frame_files: list, frame_paths: list, fps: float, scene_changes: list) -> pd.DataFrame:
+    """
+    Build the frame table column by column.
+    
+    Args:
+        frame_files: Frame file names, in frame order
+        frame_paths: Paths to the frame files, in frame order
+        fps: Frames per second used for extraction
+        scene_changes: Scene change dicts sorted by "timestamp"
+        
+    Returns:
+        DataFrame with one row per frame
+    """
+    n = len(frame_files)
+    seconds = np.arange(n) / fps
+    rounded_seconds = np.round(seconds, 2)
+    scene_numbers, scene_scores = assign_scenes(rounded_seconds, scene_changes)
+    
+    return pd.DataFrame({
+        "Timestamp": format_timestamps(seconds),
+        "Time (seconds)": rounded_seconds,
+        "Frame Number": np.arange(1, n + 1, dtype=np.int32),
+        "Frame File": np.array(frame_files, dtype=object),
+        "Frame Path": np.array(frame_paths, dtype=object),
+        "Scene Number": scene_numbers,
+        "Scene Score": scene_scores
+    }, copy=False)
+
+
+def assign_scenes(frame_times, scene_changes: list) -> tuple:
+    """
+    Assign each frame time to a scene.
     
-    lines = content.strip().split('\n')
-    for i in range(0, len(lines), 2):
-        if i + 1 < len(lines):
-            frame_line = lines[i]
-            score_line = lines[i + 1]
-            
-            # Extract timestamp
-            import re
-            pts_match = re.search(r'pts_time:(\d+\.?\d*)', frame_line)
-            score_match = re.search(r'scene_score=(\d+\.?\d*)', score_line)
-            
-            if pts_match and score_match:
-                scene_changes.append({
-                    "timestamp": float(pts_match.group(1)),
-                    "scene_score": float(score_match.group(1))
-                })
+    Scene numbers start at 1 and increase with every scene change at or
+    before the frame time; the score is that of the last such change.
     
-    # Clean up temporary file
-    if os.path.exists(temp_file):
-        os.remove(temp_file)
+    Args:
+        frame_times: Frame times in seconds
+        scene_changes: Scene change dicts sorted by "timestamp"
+        
+    Returns:
+        Tuple of (scene number array, scene score array)
+    """
+    frame_times = np.asarray(frame_times, dtype=np.float64)
+    if not scene_changes:
+        return np.ones(len(frame_times), dtype=np.int64), np.zeros(len(frame_times))
     
-    return scene_changes
+    times = np.array([s["timestamp"] for s in scene_changes])
+    scores = np.array([s["scene_score"] for s in scene_changes])
+    passed = np.searchsorted(times, frame_times, side='right')
+    scene_scores = np.where(passed > 0, scores[np.clip(passed - 1, 0, None)], 0.0)
+    return passed + 1, scene_scores
 
 
 def format_timestamp(seconds: float) -> str:
     """Format seconds to readable timestamp"""
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
-    millisecs = int((seconds % 1) * 1000)
-    return f"{hours:02d}:{minutes:02d}:{secs:02d}.{millisecs:03d}"
+    return format_timestamps([seconds])[0]
+
+
+def format_timestamps(seconds) -> list:
+    """Format an array of seconds to readable timestamps in one vectorized pass"""
+    seconds = np.asarray(seconds, dtype=np.float64)
+    whole = seconds.astype(np.int64)
+    hours, rem = np.divmod(whole, 3600)
+    minutes, secs = np.divmod(rem, 60)
+    millisecs = ((seconds - whole) * 1000).astype(np.int64)
+    return [
+        f"{h:02d}:{m:02d}:{s:02d}.{ms:03d}"
+        for h, m, s, ms in zip(hours.tolist(), minutes.tolist(), secs.tolist(), millisecs.tolist())
+    ]
+
+
+def write_frames(output_dir: str, frame_paths: list, frames: list):
+    """Write in-memory JPEG frames to their paths"""
+    os.makedirs(output_dir, exist_ok=True)
+    for frame_path, frame_bytes in zip(frame_paths, frames):
+        with open(frame_path, "wb") as f:
+            f.write(frame_bytes)
+
+
+def write_frame_table_csv(df: pd.DataFrame, csv_path: str):
+    """
+    Write the frame table to CSV, using pyarrow's writer when it is installed.
+    
+    Both writers produce the same file: float columns are pre-formatted the way
+    pandas writes them, and values are left unquoted. pyarrow can only quote
+    every string or none, so when some value needs quoting (e.g. a comma in a
+    frame path) pandas writes the file instead. pandas ends lines with
+    os.linesep, so pyarrow (always "\\n") is only used where that is "\\n".
+    """
+    if pa is not None and os.linesep == "\n":
+        float_columns = df.select_dtypes("float").columns
+        table = pa.Table.from_pandas(
+            df.astype({column: str for column in float_columns}), preserve_index=False
+        )
+        try:
+            options = pa_csv.WriteOptions(include_header=False, quoting_style="none")
+            with open(csv_path, "wb") as f:
+                f.write((",".join(df.columns) + "\n").encode("utf-8"))
+                pa_csv.write_csv(table, f, options)
+            return
+        except (pa.ArrowInvalid, TypeError):
+            # A value needs quoting, or pyarrow < 8 without quoting_style
+            pass
+    
+    df.to_csv(csv_path, index=False)
 
 
-def create_html_table(df: pd.DataFrame, output_file: str, video_name: str):
-    """Create an HTML table with embedded images, checkboxes, and a submit button to download selected frames as JSON."""
+def make_thumbnail(source) -> bytes:
+    """
+    Make a small JPEG thumbnail from JPEG bytes or an image path.
+    Without Pillow the full image is returned unchanged.
+    """
+    if Image is None:
+        if isinstance(source, bytes):
+            return source
+        with open(source, "rb") as f:
+            return f.read()
+    
+    with Image.open(io.BytesIO(source) if isinstance(source, bytes) else source) as im:
+        im.thumbnail(THUMBNAIL_SIZE)
+        buf = io.BytesIO()
+        im.convert("RGB").save(buf, "JPEG", quality=75)
+    return buf.getvalue()
+
+
+def create_html_table(df: pd.DataFrame, output_file: str, video_name: str, images: list = None,
+                      portable: bool = False):
+    """Create an HTML table with embedded images, checkboxes, and a submit button to download selected frames as JSON.
+
+    If images (JPEG bytes, one per row) are given they are inlined as data URIs instead of linking to Frame Path.
+    In portable mode thumbnails of the images (or of the Frame Path files) are inlined instead, so the HTML
+    keeps working when moved away from the frames directory.
+    """
 
     html_content = f"""
 <!DOCTYPE html>
@@ -202,14 +394,22 @@ def create_html_table(df: pd.DataFrame, output_file: str, video_name: str):
         <tbody>
 """
 
-    for _, row in df.iterrows():
-        html_content += f"""
-        <tr>
-            <td>{row['Timestamp']}</td>
-            <td><img src="{row['Frame Path']}" class="frame-image" alt="Frame at {row['Timestamp']}"></td>
-            <td class="centered"><input type="checkbox" class="frame-checkbox" data-timestamp="{row['Timestamp']}" data-frame="{row['Frame File']}"></td>
-        </tr>
-"""
+    if portable:
+        sources = images if images is not None else df["Frame Path"].tolist()
+        with ThreadPoolExecutor() as executor:
+            images = list(executor.map(make_thumbnail, sources))
+    if images is not None:
+        img_srcs = [f"data:image/jpeg;base64,{base64.b64encode(image).decode('utf-8')}" for image in images]
+    else:
+        img_srcs = df["Frame Path"].tolist()
+
+    rows = []
+    append = rows.append
+    fill_row = _HTML_ROW_TEMPLATE.format_map
+    columns = df[["Timestamp", "Frame File"]].itertuples(index=False, name=None)
+    for (timestamp, frame_file), img_src in zip(columns, img_srcs):
+        append(fill_row({"ts": timestamp, "src": img_src, "ff": frame_file}))
+    html_content += "".join(rows)
 
     html_content += """
         </tbody>
@@ -259,18 +459,21 @@ def organize_video_frames(video_path: str, **kwargs) -> dict:
     
     Args:
         video_path: Path to the video file
-        **kwargs: Additional parameters (fps, scene_threshold)
+        **kwargs: Additional parameters (fps, scene_threshold, save_frames, portable)
         
     Returns:
         Dictionary containing organization results
     """
     fps = kwargs.get("fps", 2)
     scene_threshold = kwargs.get("scene_threshold", 0.3)
+    save_frames = kwargs.get("save_frames", True)
+    portable = kwargs.get("portable", False)
     
-    return organize_frames_table(video_path, fps, scene_threshold)
+    return organize_frames_table(video_path, fps, scene_threshold, save_frames, portable)
 
 
-def organize_existing_frames_table(frames_dir: str, fps: float, video_name: str, video_path: str, scene_threshold: float = 0.3) -> dict:
+def organize_existing_frames_table(frames_dir: str, fps: float, video_name: str, video_path: str, scene_threshold: float = 0.3,
+                                   frame_count: int = None, portable: bool = False) -> dict:
     """
     Organize already-extracted frames in a directory into a table with timestamps and scene information.
     Args:
@@ -279,6 +482,9 @@ def organize_existing_frames_table(frames_dir: str, fps: float, video_name: str,
         video_name: Name of the video (for output file naming)
         video_path: Path to the original video (for scene detection)
         scene_threshold: Scene change detection threshold
+        frame_count: Expected number of frame_%04d.jpg files written by ffmpeg, if known.
+            Used to name the frames without listing the directory.
+        portable: Inline thumbnails into the HTML table so it is a single self-contained file
     Returns:
         Dictionary containing organization results
     """
@@ -289,43 +495,32 @@ def organize_existing_frames_table(frames_dir: str, fps: float, video_name: str,
         }
     try:
         print(f"\U0001F4C2 Organizing existing frames in: {frames_dir}")
-        frame_files = sorted([f for f in os.listdir(frames_dir) if f.endswith('.jpg')])
-        frames_data = []
-        for i, frame_file in enumerate(frame_files):
-            timestamp = i / fps
-            frame_path = os.path.join(frames_dir, frame_file)
-            frames_data.append({
-                "Timestamp": format_timestamp(timestamp),
-                "Time (seconds)": round(timestamp, 2),
-                "Frame Number": i + 1,
-                "Frame File": frame_file,
-                "Frame Path": frame_path
-            })
-        # Detect scene changes
         print("\U0001F3AD Detecting scene changes...")
-        scene_changes = detect_scene_changes(video_path, scene_threshold)
-        # Add scene information to frames
-        for frame in frames_data:
-            frame_time = frame["Time (seconds)"]
-            scene_number = 1
-            scene_score = 0.0
-            for scene in scene_changes:
-                if frame_time >= scene["timestamp"]:
-                    scene_number += 1
-                    scene_score = scene["scene_score"]
-                else:
-                    break
-            frame["Scene Number"] = scene_number
-            frame["Scene Score"] = scene_score
-        # Create DataFrame
-        df = pd.DataFrame(frames_data)
-        # Save to CSV
-        csv_path = f"{video_name}_frame_table.csv"
-        df.to_csv(csv_path, index=False)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            # Detect scene changes in the background while the frames are listed
+            scene_future = executor.submit(detect_scene_changes, video_path, scene_threshold)
+            frame_files = expected_frame_files(frames_dir, frame_count) if frame_count else None
+            if frame_files is not None:
+                frame_paths = [os.path.join(frames_dir, frame_file) for frame_file in frame_files]
+            else:
+                # DirEntry objects carry both the name and the joined path
+                with os.scandir(frames_dir) as it:
+                    entries = sorted((e for e in it if e.name.endswith('.jpg')), key=lambda e: e.name)
+                frame_files = [e.name for e in entries]
+                frame_paths = [e.path for e in entries]
+            scene_changes = scene_future.result()
+            # Create DataFrame with timestamps and scene information
+            df = build_frame_table(frame_files, frame_paths, fps, scene_changes)
+            # Write CSV and HTML table concurrently
+            csv_path = f"{video_name}_frame_table.csv"
+            html_path = f"{video_name}_frame_table.html"
+            writes = [
+                executor.submit(write_frame_table_csv, df, csv_path),
+                executor.submit(create_html_table, df, html_path, video_name, None, portable)
+            ]
+            for future in writes:
+                future.result()
         print(f"\U0001F4CA Frame table saved to: {csv_path}")
-        # Create HTML table
-        html_path = f"{video_name}_frame_table.html"
-        create_html_table(df, html_path, video_name)
         return {
             "status": "success",
             "video_path": video_path,
@@ -343,6 +538,19 @@ def organize_existing_frames_table(frames_dir: str, fps: float, video_name: str,
         }
 
 
+def expected_frame_files(frames_dir: str, frame_count: int) -> list:
+    """
+    Name the frames ffmpeg's frame_%04d.jpg pattern produced, without listing the directory.
+    Returns None if frame_count does not match the frames on disk.
+    """
+    frame_files = [f"frame_{i + 1:04d}.jpg" for i in range(frame_count)]
+    # Check the boundary: the last expected frame exists and the next one does not
+    if (not os.path.exists(os.path.join(frames_dir, frame_files[-1]))
+            or os.path.exists(os.path.join(frames_dir, f"frame_{frame_count + 1:04d}.jpg"))):
+        return None
+    return frame_files
+
+
 # --- CHAINED MAIN ---
 def main():
     """Chain: Run extraction/analysis, then organize frames."""
@@ -354,6 +562,7 @@ def main():
     frames_output_dir = f"{video_name}_extracted_frames"
     fps = 1  # 1 frame per second for extraction
     scene_threshold = 0.2
+    frame_count = None
     # Step 1: Extraction/Analysis (as in example_usage.py)
     try:
         from video_processor import ffmpeg_video_search
@@ -376,6 +585,7 @@ def main():
         print(f"   Format: {metadata.format}")
         print(f"   Size: {metadata.size_mb:.2f} MB")
         print(f"   Bitrate: {metadata.bitrate} bps")
+        frame_count = round(metadata.duration * fps)
     print("\n" + "=" * 50)
     print("\U0001F3AD Example 2: Scene Change Detection")
     print("=" * 50)
@@ -408,7 +618,7 @@ def main():
     print("\n" + "=" * 50)
     # Step 2: Organize the extracted frames
     result = organize_existing_frames_table(
-        frames_output_dir, fps, video_name, video_file, scene_threshold
+        frames_output_dir, fps, video_name, video_file, scene_threshold, frame_count
     )
     if result["status"] == "success":
         print(f"\u2705 Frame organization successful!")
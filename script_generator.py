@@ -1,52 +1,57 @@
 import os
+import io
+import asyncio
 import base64
 import json
-from openai import OpenAI
+import hashlib
+import tempfile
+from functools import lru_cache
+from pathlib import Path
+from urllib.parse import quote
+from concurrent.futures import ThreadPoolExecutor
+from openai import AsyncOpenAI
 from dotenv import load_dotenv
 load_dotenv()
 
-client = OpenAI(
-    api_key=os.getenv("OPENAI_API_KEY"),
-    base_url=os.getenv("OPENAI_BASE_URL")
-)
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
 
-def encode_image_to_base64(image_path):
-    with open(image_path, "rb") as img_file:
-        return base64.b64encode(img_file.read()).decode("utf-8")
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-def analyze_all_frames_together(frames_data, movie_style, target_audience):
-    """
-    Send all selected frames to the LLM in a single API call for comprehensive analysis
-    """
-    try:
-        # Create personalized prompt based on style and audience
-        style_instructions = ""
-        if movie_style == "serious":
-            style_instructions = "保持严肃、专业的语调，避免幽默或轻松的表达。"
-        elif movie_style == "funny":
-            style_instructions = "使用轻松、幽默的语调，可以适当添加有趣的描述。"
-        elif movie_style == "dramatic":
-            style_instructions = "使用戏剧性的语调，强调情感和氛围。"
-        elif movie_style == "educational":
-            style_instructions = "使用教育性的语调，注重解释和说明。"
-        else:
-            style_instructions = "使用中性、平衡的语调。"
-
-        audience_instructions = ""
-        if target_audience == "children":
-            audience_instructions = "使用简单易懂的词汇，避免复杂概念，保持积极、快乐的氛围，使用温暖的语调。"
-        elif target_audience == "adults":
-            audience_instructions = "可以使用更丰富的词汇和概念，适合成年人的理解水平。"
-        elif target_audience == "elderly":
-            audience_instructions = "使用清晰、缓慢的描述，避免快速变化的场景描述，保持温和的语调。"
-        else:
-            audience_instructions = "使用适合一般观众的平衡语调。"
+# URL the frames directory is served from. When set, frames are sent to the
+# model as URLs instead of being base64-encoded into the request body.
+frames_base_url = os.getenv("FRAMES_BASE_URL")
+
+# Frames are downscaled and re-encoded before upload when Pillow is available;
+# vision models resize large images anyway
+MAX_IMAGE_SIDE = 768
+JPEG_QUALITY = 75
+
+# Encoded frames are cached here so reruns on the same selection skip re-encoding
+CACHE_DIR = Path.home() / ".cache" / "adscriptgen" / "b64"
 
-        # Prepare all images for the API call
-        content = [
-            {
-                "type": "text",
-                "text": f"""你正在分析一系列讲述故事的视频帧。
+# Tone instructions per movie style and target audience, with their fallbacks
+_STYLE_INSTRUCTIONS = {
+    "serious": "保持严肃、专业的语调，避免幽默或轻松的表达。",
+    "funny": "使用轻松、幽默的语调，可以适当添加有趣的描述。",
+    "dramatic": "使用戏剧性的语调，强调情感和氛围。",
+    "educational": "使用教育性的语调，注重解释和说明。",
+    "neutral": "使用中性、平衡的语调。"
+}
+
+_AUDIENCE_INSTRUCTIONS = {
+    "children": "使用简单易懂的词汇，避免复杂概念，保持积极、快乐的氛围，使用温暖的语调。",
+    "adults": "可以使用更丰富的词汇和概念，适合成年人的理解水平。",
+    "elderly": "使用清晰、缓慢的描述，避免快速变化的场景描述，保持温和的语调。",
+    "general": "使用适合一般观众的平衡语调。"
+}
+
+_PROMPT_TEMPLATE = """你正在分析一系列讲述故事的视频帧。
 
 请检查所有帧并创建一系列简洁但富有情感和全面的描述，这些描述可以在特定的时间间隔内进行语音播报。
 
@@ -68,55 +73,167 @@ def analyze_all_frames_together(frames_data, movie_style, target_audience):
 - {audience_instructions}
 
 请将你的回答格式化为一系列时间戳描述，每个帧一个描述。"""
-            }
-        ]
+
+def encode_image_to_base64(image_path):
+    st = os.stat(image_path)
+    return _encode_image_cached(os.path.abspath(image_path), st.st_mtime_ns, st.st_size)
+
+@lru_cache(maxsize=1024)
+def _encode_image_cached(image_path, mtime_ns, size):
+    """Encode an image, memoized in-process and on disk by (path, mtime, size) and encoding settings"""
+    key = f"{image_path}|{mtime_ns}|{size}|{Image is not None}|{MAX_IMAGE_SIDE}|{JPEG_QUALITY}"
+    cache_file = CACHE_DIR / f"{hashlib.sha1(key.encode('utf-8')).hexdigest()}.b64"
+    try:
+        return cache_file.read_text(encoding="utf-8")
+    except OSError:
+        pass
+
+    encoded = _encode_image(image_path)
+
+    # Caching is best effort; write to a temp file first so readers never see a partial entry
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=CACHE_DIR, delete=False) as tmp_file:
+            tmp_file.write(encoded)
+        os.replace(tmp_file.name, cache_file)
+    except OSError as e:
+        print(f"Warning: Could not cache encoded image {image_path}: {e}")
+    return encoded
+
+def _encode_image(image_path):
+    if Image is None:
+        with open(image_path, "rb") as img_file:
+            return base64.b64encode(img_file.read()).decode("utf-8")
+
+    with Image.open(image_path) as im:
+        im.thumbnail((MAX_IMAGE_SIDE, MAX_IMAGE_SIDE))
+        buf = io.BytesIO()
+        im.convert("RGB").save(buf, "JPEG", quality=JPEG_QUALITY, optimize=True)
+    return base64.b64encode(buf.getvalue()).decode("utf-8")
+
+def frame_image_url(frame_info):
+    """URL of a frame under FRAMES_BASE_URL"""
+    frame_file = frame_info.get("frame_file") or os.path.basename(frame_info["image_path"])
+    return f"{frames_base_url.rstrip('/')}/{quote(frame_file)}"
+
+def analyze_all_frames_together(frames_data, movie_style, target_audience, chunk_size=None):
+    """
+    Send the selected frames to the LLM for comprehensive analysis.
+
+    By default all frames go in a single API call, so the model sees the whole
+    story. With chunk_size, frames are split into chunks sent as concurrent
+    requests and the descriptions are merged in timestamp order; each chunk is
+    described without the others' context, so the storyline may restart at
+    chunk boundaries. A failed chunk is reported in place and the others are kept.
+    """
+    try:
+        # Create personalized prompt based on style and audience
+        prompt = _PROMPT_TEMPLATE.format(
+            movie_style=movie_style,
+            target_audience=target_audience,
+            style_instructions=_STYLE_INSTRUCTIONS.get(movie_style, _STYLE_INSTRUCTIONS["neutral"]),
+            audience_instructions=_AUDIENCE_INSTRUCTIONS.get(target_audience, _AUDIENCE_INSTRUCTIONS["general"])
+        )
+
+        frames_data = sorted(frames_data, key=lambda frame_info: frame_info["timestamp"])
         
-        # Add each image with its timestamp
-        for frame_info in frames_data:
-            timestamp = frame_info["timestamp"]
-            image_path = frame_info["image_path"]
-            
-            # Encode the image
-            base64_image = encode_image_to_base64(image_path)
-            if not base64_image:
-                print(f"Warning: Could not encode image {image_path}")
+        if frames_base_url:
+            # Frames are served over HTTP, reference them by URL
+            image_urls = [frame_image_url(frame_info) for frame_info in frames_data]
+        else:
+            # Encode the images in parallel, each frame is read and encoded independently
+            image_paths = [frame_info["image_path"] for frame_info in frames_data]
+            with ThreadPoolExecutor(max_workers=min(32, len(image_paths)) or 1) as executor:
+                encoded_images = list(executor.map(encode_image_to_base64, image_paths))
+            image_urls = [
+                f"data:image/jpeg;base64,{base64_image}" if base64_image else None
+                for base64_image in encoded_images
+            ]
+        
+        frames = []
+        for frame_info, image_url in zip(frames_data, image_urls):
+            if not image_url:
+                print(f"Warning: Could not encode image {frame_info['image_path']}")
                 continue
-                
-            # Add image to content
-            content.append({
-                "type": "image_url",
-                "image_url": {
-                    "url": f"data:image/jpeg;base64,{base64_image}"
-                }
-            })
-            
-            # Add timestamp label
-            content.append({
-                "type": "text",
-                "text": f"\n[Frame at {timestamp}]"
-            })
+            frames.append((frame_info["timestamp"], image_url))
+        
+        chunk_size = chunk_size or len(frames) or 1
+        chunks = [frames[i:i + chunk_size] for i in range(0, len(frames), chunk_size)]
         
-        print(f"Sending {len(frames_data)} frames to OpenAI API for comprehensive analysis...")
+        print(f"Sending {len(frames_data)} frames to OpenAI API in {len(chunks)} request(s) for comprehensive analysis...")
         print(f"Style: {movie_style}, Target Audience: {target_audience}")
         
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {
-                    "role": "user",
-                    "content": content
-                }
-            ],
-            max_tokens=16000
-        )
+        results = asyncio.run(_analyze_chunks(prompt, chunks))
+        if results and all(isinstance(result, Exception) for result in results):
+            raise results[0]
+        
+        descriptions = []
+        for chunk, result in zip(chunks, results):
+            if isinstance(result, Exception):
+                time_range = f"{chunk[0][0]} - {chunk[-1][0]}"
+                print(f"Warning: Could not analyze frames {time_range}: {result}")
+                descriptions.append(f"[{time_range}] Error: {result}")
+            else:
+                descriptions.append(result)
         
         print("Received comprehensive analysis from OpenAI API")
-        return response.choices[0].message.content.strip()
+        return "\n".join(descriptions)
         
     except Exception as e:
         print(f"Error analyzing frames together: {e}")
         return f"Error: {e}"
 
+def build_content(prompt, frames):
+    """Build the message content for a list of (timestamp, image_url) frames"""
+    content = [
+        {
+            "type": "text",
+            "text": prompt
+        }
+    ]
+    
+    # Add each image with its timestamp
+    for timestamp, image_url in frames:
+        content.append({
+            "type": "image_url",
+            "image_url": {
+                "url": image_url
+            }
+        })
+        
+        # Add timestamp label
+        content.append({
+            "type": "text",
+            "text": f"\n[Frame at {timestamp}]"
+        })
+    
+    return content
+
+async def _analyze_chunks(prompt, chunks):
+    """
+    Send one request per chunk concurrently, returning the descriptions in chunk order.
+    A chunk whose request fails (after the client's own retries) yields its exception.
+    """
+    # The client's connection pool is bound to the running event loop, so it lives per call
+    async with AsyncOpenAI(
+        api_key=os.getenv("OPENAI_API_KEY"),
+        base_url=os.getenv("OPENAI_BASE_URL")
+    ) as client:
+        async def analyze_chunk(frames):
+            response = await client.chat.completions.create(
+                model="gpt-4o-mini",
+                messages=[
+                    {
+                        "role": "user",
+                        "content": build_content(prompt, frames)
+                    }
+                ],
+                max_tokens=16000
+            )
+            return response.choices[0].message.content.strip()
+        
+        return await asyncio.gather(*(analyze_chunk(frames) for frames in chunks), return_exceptions=True)
+
 def main():
     # Ask user for prefix
     prefix = input("Enter the file name prefix (e.g., 'Bun'): ").strip()
@@ -170,8 +287,11 @@ def main():
         print(f"Frames directory '{frames_dir}' not found. Exiting.")
         return
         
-    with open(selected_json_file, "r", encoding="utf-8") as f:
-        selected_frames = json.load(f)
+    if orjson is not None:
+        selected_frames = orjson.loads(Path(selected_json_file).read_bytes())
+    else:
+        with open(selected_json_file, "r", encoding="utf-8") as f:
+            selected_frames = json.load(f)
     if not selected_frames:
         print(f"No frames found in {selected_json_file}. Exiting.")
         return
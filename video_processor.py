@@ -1,17 +1,69 @@
 import subprocess
 import json
 import os
+import io
 import re
-from typing import Dict, List, Optional, Union, Tuple
+import math
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Literal, Optional, Union, Tuple
 from dataclasses import dataclass
 from pathlib import Path
-import tempfile
 import shutil
+import tempfile
 
+import numpy as np
 
-@dataclass
-class VideoMetadata:
+try:
+    import av
+except ImportError:
+    av = None
+
+
+# FFmpeg executables already checked by _check_ffmpeg_availability, mapped to their version
+_FFMPEG_VERIFIED: Dict[str, str] = {}
+
+# Silero VAD settings used to skip silent stretches before faster-whisper's encoder
+VAD_PARAMETERS = dict(min_silence_duration_ms=500, threshold=0.5)
+
+# Whisper model per transcription quality and backend; the English-only draft
+# models trade some accuracy for speed (distil-small.en is faster-whisper only)
+QUALITY_MODELS = {
+    "draft": {"faster-whisper": "Systran/faster-distil-whisper-small.en", "whisper": "tiny.en"},
+    "balanced": {"faster-whisper": "base", "whisper": "base"},
+    "accurate": {"faster-whisper": "large-v3", "whisper": "large-v3"},
+}
+
+# One entry of ffmpeg's metadata=mode=print output, e.g.
+# "frame:3    pts:12012   pts_time:0.5005" followed by "lavfi.scene_score=0.412"
+_SCENE_ENTRY_RE = re.compile(
+    r'frame:\s*(\d+)\s+pts:\s*\S+\s+pts_time:\s*(-?\d+\.?\d*)[^\n]*\n[^\n]*?scene_score=(\d+\.?\d*)'
+)
+_SCENE_DTYPE = np.dtype([('frame_number', np.int32), ('timestamp', np.float64), ('scene_score', np.float64)])
+
+class _FrozenSlots:
+    """
+    Pickle/copy support for frozen dataclasses with hand-written __slots__.
+    
+    The default slot-state restore assigns through the frozen __setattr__ and
+    fails, so state is set with object.__setattr__ like dataclass(slots=True) does.
+    """
+    __slots__ = ()
+    
+    def __getstate__(self):
+        return [getattr(self, name) for name in self.__slots__]
+    
+    def __setstate__(self, state):
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+
+
+# Records are frozen and slotted (no per-instance __dict__); dataclass(slots=True)
+# needs Python 3.10, so __slots__ is spelled out to keep 3.8 support
+@dataclass(frozen=True)
+class VideoMetadata(_FrozenSlots):
     """Data class to store video metadata"""
+    __slots__ = ("duration", "width", "height", "fps", "bitrate", "codec", "format", "size_mb")
     duration: float
     width: int
     height: int
@@ -22,9 +74,10 @@ class VideoMetadata:
     size_mb: float
 
 
-@dataclass
-class SceneChange:
+@dataclass(frozen=True)
+class SceneChange(_FrozenSlots):
     """Data class to store scene change information"""
+    __slots__ = ("timestamp", "frame_number", "scene_score")
     timestamp: float
     frame_number: int
     scene_score: float
@@ -41,6 +94,35 @@ class VideoAnalysis:
     transcription_timestamps: Optional[List[Dict]] = None
 
 
+def _parse_frame_rate(rate: str) -> float:
+    """Convert an ffprobe rate such as "30000/1001" to a float."""
+    num, _, den = rate.partition('/')
+    if not den:
+        return float(num)
+    return int(num) / int(den) if int(den) else 0.0
+
+
+def _parse_scene_change(frame_line: str, score_line: str) -> Optional[SceneChange]:
+    """
+    Parse one entry of ffmpeg's metadata=mode=print output.
+    
+    The format is fixed, e.g. "frame:3    pts:12012   pts_time:0.5005"
+    followed by "lavfi.scene_score=0.412", so plain string splitting suffices.
+    """
+    fields = dict(token.split(':', 1) for token in frame_line.split() if ':' in token)
+    key, _, score = score_line.strip().rpartition('=')
+    if not key.endswith('scene_score') or 'pts_time' not in fields or 'frame' not in fields:
+        return None
+    try:
+        return SceneChange(
+            timestamp=float(fields['pts_time']),
+            frame_number=int(fields['frame']),
+            scene_score=float(score)
+        )
+    except ValueError:
+        return None
+
+
 class FFmpegVideoProcessor:
     """
     A comprehensive video processing class similar to duckduckgo_search
@@ -55,29 +137,63 @@ class FFmpegVideoProcessor:
             ffmpeg_path: Path to FFmpeg executable
         """
         self.ffmpeg_path = ffmpeg_path
+        # Loaded Whisper models keyed by (backend, model_size, device, compute_type)
+        self._whisper_cache: Dict[Tuple, Any] = {}
+        self._whisper_lock = threading.Lock()
+        # Hardware acceleration methods reported by `ffmpeg -hwaccels`, probed on first use
+        self._hwaccels: Optional[List[str]] = None
         self._check_ffmpeg_availability()
     
     def _check_ffmpeg_availability(self) -> None:
         """Check if FFmpeg is available in the system."""
+        if self.ffmpeg_path in _FFMPEG_VERIFIED:
+            return
+        
         try:
             result = subprocess.run([self.ffmpeg_path, "-version"], 
                                   capture_output=True, text=True, check=True)
-            print(f"✓ FFmpeg available: {result.stdout.split()[2]}")
+            _FFMPEG_VERIFIED[self.ffmpeg_path] = result.stdout.split()[2]
+            print(f"✓ FFmpeg available: {_FFMPEG_VERIFIED[self.ffmpeg_path]}")
         except (subprocess.CalledProcessError, FileNotFoundError):
             raise RuntimeError("FFmpeg not found. Please install FFmpeg first.")
     
-    def get_video_metadata(self, video_path: str) -> VideoMetadata:
+    def _available_hwaccels(self) -> List[str]:
+        """Return the hardware acceleration methods this FFmpeg build supports."""
+        if self._hwaccels is None:
+            try:
+                result = subprocess.run([self.ffmpeg_path, "-hide_banner", "-hwaccels"],
+                                        capture_output=True, text=True, check=True)
+                # First line is the "Hardware acceleration methods:" header
+                self._hwaccels = [line.strip() for line in result.stdout.splitlines()[1:] if line.strip()]
+            except subprocess.CalledProcessError:
+                self._hwaccels = []
+        return self._hwaccels
+    
+    def get_video_metadata(self, video_path: str,
+                           stat: Optional[Union[os.stat_result, os.DirEntry]] = None) -> VideoMetadata:
         """
         Extract comprehensive metadata from a video file.
         
         Args:
             video_path: Path to the video file
+            stat: The file's os.stat() result, or its os.DirEntry from os.scandir,
+                if the caller already has one; saves another stat of the file
             
         Returns:
             VideoMetadata object containing video information
         """
+        if stat is None:
+            stat = os.stat(video_path)
+        elif isinstance(stat, os.DirEntry):
+            stat = stat.stat()  # cached by the DirEntry
+        
         # Get file size
-        file_size = os.path.getsize(video_path) / (1024 * 1024)  # MB
+        file_size = stat.st_size / 1048576  # MB
+        
+        # Read metadata in-process with PyAV when available
+        metadata = self._get_video_metadata_av(video_path, file_size)
+        if metadata is not None:
+            return metadata
         
         # Get detailed metadata using ffprobe
         probe_cmd = [
@@ -100,7 +216,7 @@ class FFmpegVideoProcessor:
                 duration=float(data['format']['duration']),
                 width=int(video_stream['width']),
                 height=int(video_stream['height']),
-                fps=eval(video_stream['r_frame_rate']),  # Convert fraction to float
+                fps=_parse_frame_rate(video_stream['r_frame_rate']),
                 bitrate=int(data['format']['bit_rate']),
                 codec=video_stream['codec_name'],
                 format=data['format']['format_name'],
@@ -110,6 +226,40 @@ class FFmpegVideoProcessor:
         except subprocess.CalledProcessError as e:
             raise RuntimeError(f"Failed to extract metadata: {e}")
     
+    def _get_video_metadata_av(self, video_path: str, file_size: float) -> Optional[VideoMetadata]:
+        """
+        Read video metadata through libavformat with PyAV, avoiding an ffprobe fork.
+        
+        Returns None when PyAV is not installed or cannot provide the metadata,
+        so the caller falls back to ffprobe.
+        """
+        if av is None:
+            return None
+        
+        try:
+            with av.open(video_path) as container:
+                if not container.streams.video:
+                    raise ValueError("No video stream found in the file")
+                video_stream = container.streams.video[0]
+                
+                if container.duration is None:
+                    return None
+                
+                # base_rate is libav's r_frame_rate, the same field ffprobe reports
+                rate = video_stream.base_rate or video_stream.average_rate
+                return VideoMetadata(
+                    duration=container.duration / av.time_base,
+                    width=video_stream.width,
+                    height=video_stream.height,
+                    fps=float(rate) if rate else 0.0,
+                    bitrate=int(container.bit_rate or 0),
+                    codec=video_stream.codec_context.name,
+                    format=container.format.name,
+                    size_mb=file_size
+                )
+        except av.error.FFmpegError:
+            return None
+    
     def detect_scene_changes(self, video_path: str, threshold: float = 0.3) -> List[SceneChange]:
         """
         Detect scene changes in a video using FFmpeg.
@@ -121,51 +271,136 @@ class FFmpegVideoProcessor:
         Returns:
             List of SceneChange objects
         """
-        # Create temporary file for scene detection output
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as tmp_file:
-            tmp_output = tmp_file.name
+        scenes = self._run_scene_detection(self._scene_detection_cmd(video_path, threshold))
+        return self._scene_changes_from_array(scenes)
+    
+    def detect_scene_changes_np(self, video_path: str,
+                                threshold: float = 0.3) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Detect scene changes and return them as parallel NumPy arrays.
         
-        try:
-            cmd = [
-                self.ffmpeg_path, "-i", video_path,
-                "-vf", f"select='gt(scene,{threshold})',metadata=mode=print:file={tmp_output}",
-                "-f", "null", "-"
-            ]
-            
-            subprocess.run(cmd, capture_output=True, check=True)
-            
-            # Parse the output file
-            scene_changes = []
-            with open(tmp_output, 'r') as f:
-                content = f.read()
+        Denser than a list of SceneChange objects and lets callers filter the
+        whole set in one sweep, e.g. ``timestamps[scores > 0.5]``.
+        
+        Args:
+            video_path: Path to the video file
+            threshold: Scene change detection threshold (0.0 to 1.0)
             
-            # Parse scene change data
-            lines = content.strip().split('\n')
-            for i in range(0, len(lines), 2):
-                if i + 1 < len(lines):
-                    frame_line = lines[i]
-                    score_line = lines[i + 1]
-                    
-                    # Extract timestamp
-                    pts_match = re.search(r'pts_time:(\d+\.?\d*)', frame_line)
-                    frame_match = re.search(r'frame:(\d+)', frame_line)
-                    score_match = re.search(r'scene_score=(\d+\.?\d*)', score_line)
-                    
-                    if pts_match and frame_match and score_match:
-                        scene_changes.append(SceneChange(
-                            timestamp=float(pts_match.group(1)),
-                            frame_number=int(frame_match.group(1)),
-                            scene_score=float(score_match.group(1))
-                        ))
+        Returns:
+            Tuple of (timestamps float32, frame_numbers int32, scene_scores float32)
+        """
+        scenes = self._run_scene_detection(self._scene_detection_cmd(video_path, threshold))
+        # Copy the strided record fields out into contiguous columns
+        return (
+            scenes['timestamp'].astype(np.float32),
+            np.ascontiguousarray(scenes['frame_number']),
+            scenes['scene_score'].astype(np.float32)
+        )
+    
+    def iter_scene_changes(self, video_path: str, threshold: float = 0.3) -> Iterator[SceneChange]:
+        """
+        Yield scene changes as FFmpeg detects them.
+        
+        Closing the generator early (e.g. breaking out of a loop after the
+        first few scenes for a preview) terminates FFmpeg instead of decoding
+        the rest of the video.
+        
+        Args:
+            video_path: Path to the video file
+            threshold: Scene change detection threshold (0.0 to 1.0)
             
-            return scene_changes
+        Yields:
+            SceneChange objects in timestamp order
+        """
+        return self._iter_scene_detection(self._scene_detection_cmd(video_path, threshold))
+    
+    def _scene_detection_cmd(self, video_path: str, threshold: float) -> List[str]:
+        """Build the FFmpeg command that prints scene change metadata to stdout."""
+        # file=- makes the metadata filter print to stdout; the null muxer writes nothing there
+        return [
+            self.ffmpeg_path, "-i", video_path,
+            "-vf", f"select='gt(scene,{threshold})',metadata=mode=print:file=-",
+            "-f", "null", "-"
+        ]
+    
+    def extract_and_detect(self, video_path: str, threshold: float = 0.3, fps: float = 2,
+                           frames_dir: str = "frames") -> Tuple[str, List[SceneChange]]:
+        """
+        Extract frames and detect scene changes in a single FFmpeg decode pass.
+        
+        The decoded stream is split in the filtergraph: one branch feeds the
+        scene detector, the other the fps sampler writing JPEGs.
+        
+        Args:
+            video_path: Path to the video file
+            threshold: Scene change detection threshold (0.0 to 1.0)
+            fps: Frames per second to extract
+            frames_dir: Directory to save extracted frames
             
+        Returns:
+            Tuple of (frames directory, list of SceneChange objects)
+        """
+        os.makedirs(frames_dir, exist_ok=True)
+        
+        cmd = [
+            self.ffmpeg_path, "-i", video_path,
+            "-filter_complex",
+            f"[0:v]split=2[v1][v2];"
+            f"[v1]select='gt(scene,{threshold})',metadata=mode=print:file=-[scenes];"
+            f"[v2]fps={fps}[frames]",
+            "-map", "[scenes]", "-f", "null", "-",
+            "-map", "[frames]", f"{frames_dir}/frame_%04d.jpg"
+        ]
+        
+        return frames_dir, self._scene_changes_from_array(self._run_scene_detection(cmd))
+    
+    def _run_scene_detection(self, cmd: List[str]) -> np.ndarray:
+        """Run an FFmpeg scene detection command to completion and bulk-parse its output."""
+        result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                                text=True, check=True)
+        # One regex pass in C over the whole output instead of a Python loop per entry
+        return np.fromregex(io.StringIO(result.stdout), _SCENE_ENTRY_RE, _SCENE_DTYPE)
+    
+    @staticmethod
+    def _scene_changes_from_array(scenes: np.ndarray) -> List[SceneChange]:
+        """Build SceneChange objects from a _SCENE_DTYPE structured array."""
+        return [
+            SceneChange(timestamp=timestamp, frame_number=frame_number, scene_score=score)
+            for timestamp, frame_number, score in zip(
+                scenes['timestamp'].tolist(), scenes['frame_number'].tolist(), scenes['scene_score'].tolist()
+            )
+        ]
+    
+    def _iter_scene_detection(self, cmd: List[str]) -> Iterator[SceneChange]:
+        """Run an FFmpeg command whose metadata filter prints to stdout and yield the scene changes."""
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                                bufsize=1, text=True)
+        finished = False
+        try:
+            # Parse scene change data while ffmpeg is still decoding; each selected
+            # frame prints a frame/pts line followed by its scene score line
+            frame_line = None
+            for line in proc.stdout:
+                if frame_line is None:
+                    frame_line = line
+                    continue
+                scene_change = _parse_scene_change(frame_line, line)
+                frame_line = None
+                if scene_change is not None:
+                    yield scene_change
+            finished = True
         finally:
-            # Clean up temporary file
-            if os.path.exists(tmp_output):
-                os.unlink(tmp_output)
+            if not finished:
+                # Consumer stopped early or parsing failed; don't decode the rest
+                proc.terminate()
+            proc.stdout.close()
+            proc.wait()
+        
+        if proc.returncode != 0:
+            raise subprocess.CalledProcessError(proc.returncode, cmd)
     
-    def extract_frames(self, video_path: str, fps: float = 2, output_dir: str = "frames") -> str:
+    def extract_frames(self, video_path: str, fps: float = 2, output_dir: str = "frames",
+                       hwaccel: bool = True) -> str:
         """
         Extract frames from video at specified FPS.
         
@@ -173,61 +408,530 @@ class FFmpegVideoProcessor:
             video_path: Path to the video file
             fps: Frames per second to extract
             output_dir: Directory to save extracted frames
+            hwaccel: Decode on the GPU with NVDEC when FFmpeg supports CUDA,
+                falling back to software decoding if that fails
             
         Returns:
             Path to the output directory
         """
         os.makedirs(output_dir, exist_ok=True)
         
+        if hwaccel and "cuda" in self._available_hwaccels():
+            # Frames stay on the GPU through the fps filter and are only
+            # downloaded for the JPEG encoder
+            cmd = [
+                self.ffmpeg_path, "-hwaccel", "cuda", "-hwaccel_output_format", "cuda",
+                "-i", video_path,
+                "-vf", f"fps={fps},hwdownload,format=nv12",
+                f"{output_dir}/frame_%04d.jpg"
+            ]
+            try:
+                subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+                return output_dir
+            except subprocess.CalledProcessError:
+                # No usable GPU or unsupported codec/pixel format. Builds list cuda
+                # even without an NVIDIA GPU, so stop trying it on this processor
+                # rather than paying for a failing ffmpeg run on every call
+                self._hwaccels = [method for method in self._hwaccels if method != "cuda"]
+        
         cmd = [
             self.ffmpeg_path, "-i", video_path,
             "-vf", f"fps={fps}",
             f"{output_dir}/frame_%04d.jpg"
         ]
         
-        subprocess.run(cmd, capture_output=True, check=True)
+        subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
         return output_dir
     
+    def extract_frames_batch(self, video_paths: List[str], fps: float = 2,
+                             output_dir: str = "frames") -> Dict[str, str]:
+        """
+        Extract frames from several videos with a single FFmpeg process.
+        
+        Each input gets its own fps branch in one filtergraph, so the process
+        launch is paid once rather than per video.
+        
+        Args:
+            video_paths: Paths to the video files
+            fps: Frames per second to extract
+            output_dir: Directory under which each video gets a subdirectory named after its file
+            
+        Returns:
+            Dictionary mapping each video path to its frames directory
+        """
+        if not video_paths:
+            return {}
+        
+        names = [Path(video_path).stem for video_path in video_paths]
+        if len(set(names)) != len(names):
+            raise ValueError("Video file names must be unique to get separate frame directories")
+        
+        frames_dirs = {}
+        cmd = [self.ffmpeg_path]
+        for video_path, name in zip(video_paths, names):
+            cmd += ["-i", video_path]
+            frames_dirs[video_path] = os.path.join(output_dir, name)
+            os.makedirs(frames_dirs[video_path], exist_ok=True)
+        
+        cmd += ["-filter_complex", ";".join(f"[{i}:v]fps={fps}[o{i}]" for i in range(len(video_paths)))]
+        for i, video_path in enumerate(video_paths):
+            cmd += ["-map", f"[o{i}]", f"{frames_dirs[video_path]}/frame_%04d.jpg"]
+        
+        subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+        return frames_dirs
+    
+    def detect_scene_changes_batch(self, video_paths: List[str],
+                                   threshold: float = 0.3) -> Dict[str, List[SceneChange]]:
+        """
+        Detect scene changes in several videos with a single FFmpeg process.
+        
+        Each input gets its own scene detection branch in one filtergraph, whose
+        metadata filter prints to a separate file, so the process launch is paid
+        once rather than per video.
+        
+        Args:
+            video_paths: Paths to the video files
+            threshold: Scene change detection threshold (0.0 to 1.0)
+            
+        Returns:
+            Dictionary mapping each video path to its list of SceneChange objects
+        """
+        if not video_paths:
+            return {}
+        
+        # The metadata paths are pasted into the filtergraph unescaped, so keep them
+        # to a random relative directory name plus fixed file names
+        temp_dir = os.path.basename(tempfile.mkdtemp(prefix="temp_scene_detection_", dir="."))
+        metadata_files = [f"{temp_dir}/scenes_{i}.txt" for i in range(len(video_paths))]
+        
+        cmd = [self.ffmpeg_path]
+        for video_path in video_paths:
+            cmd += ["-i", video_path]
+        # Each detector ends in a nullsink and an untouched copy of the stream feeds
+        # the null output, since an output that receives no frames (a video without
+        # scene changes) makes ffmpeg fail
+        cmd += ["-filter_complex", ";".join(
+            f"[{i}:v]split=2[d{i}][s{i}];"
+            f"[d{i}]select='gt(scene,{threshold})',metadata=mode=print:file={metadata_file},nullsink"
+            for i, metadata_file in enumerate(metadata_files)
+        )]
+        for i in range(len(video_paths)):
+            cmd += ["-map", f"[s{i}]", "-f", "null", "-"]
+        
+        try:
+            subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+            return {
+                video_path: self._scene_changes_from_array(
+                    np.fromregex(metadata_file, _SCENE_ENTRY_RE, _SCENE_DTYPE)
+                )
+                for video_path, metadata_file in zip(video_paths, metadata_files)
+            }
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+    
+    def extract_frames_np(self, video_path: str, fps: float = 2,
+                          width: Optional[int] = None, height: Optional[int] = None) -> np.ndarray:
+        """
+        Extract frames as decoded RGB pixels, without a JPEG encode/decode round-trip.
+        
+        FFmpeg writes raw rgb24 frames to a pipe, which are read straight into
+        a preallocated array.
+        
+        Args:
+            video_path: Path to the video file
+            fps: Frames per second to extract
+            width: Output frame width (default: source width, or scaled with height)
+            height: Output frame height (default: source height, or scaled with width)
+            
+        Returns:
+            uint8 array of shape (n_frames, height, width, 3)
+        """
+        metadata = self.get_video_metadata(video_path)
+        if width is None and height is None:
+            width, height = metadata.width, metadata.height
+        elif height is None:
+            height = round(metadata.height * width / metadata.width)
+        elif width is None:
+            width = round(metadata.width * height / metadata.height)
+        frame_size = width * height * 3
+        
+        # Estimated frame count; the array grows if FFmpeg emits more
+        capacity = max(1, math.ceil(metadata.duration * fps) + 1)
+        frames = np.empty((capacity, height, width, 3), dtype=np.uint8)
+        count = 0
+        
+        cmd = [
+            self.ffmpeg_path, "-i", video_path,
+            "-vf", f"fps={fps},scale={width}:{height}",
+            "-pix_fmt", "rgb24", "-f", "rawvideo", "pipe:1"
+        ]
+        
+        with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL) as proc:
+            while True:
+                if count == capacity:
+                    capacity *= 2
+                    grown = np.empty((capacity, height, width, 3), dtype=np.uint8)
+                    grown[:count] = frames[:count]
+                    frames = grown
+                
+                view = memoryview(frames[count]).cast('B')
+                filled = 0
+                while filled < frame_size:
+                    n = proc.stdout.readinto(view[filled:])
+                    if not n:
+                        break
+                    filled += n
+                if filled < frame_size:
+                    break
+                count += 1
+        
+        if proc.returncode != 0:
+            raise subprocess.CalledProcessError(proc.returncode, cmd)
+        
+        return frames[:count]
+    
+    def _extract_audio_16k(self, video_path: str) -> np.ndarray:
+        """
+        Decode the audio track to the 16 kHz mono float32 samples Whisper expects.
+        
+        Args:
+            video_path: Path to the video file
+            
+        Returns:
+            1-D float32 array of samples in [-1, 1)
+        """
+        cmd = [
+            self.ffmpeg_path, "-nostdin", "-i", video_path,
+            "-vn", "-ac", "1", "-ar", "16000", "-f", "s16le", "pipe:1"
+        ]
+        result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, check=True)
+        
+        audio = np.frombuffer(result.stdout, dtype=np.int16).astype(np.float32)
+        audio /= 32768.0
+        return audio
+    
     def transcribe_audio(self, video_path: str, language: str = None, 
-                        output_dir: str = "transcriptions") -> Tuple[str, List[Dict]]:
+                        output_dir: str = "transcriptions",
+                        backend: str = "faster-whisper",
+                        model_size: str = "base",
+                        word_timestamps: bool = False,
+                        vad_filter: bool = True,
+                        audio: Optional[np.ndarray] = None,
+                        quality: Optional[Literal["draft", "balanced", "accurate"]] = None) -> Tuple[str, List[Dict]]:
         """
         Transcribe audio from video using Whisper (if available).
         
         Args:
             video_path: Path to the video file
-            language: Language code for transcription
+            language: Language code for transcription (skips language detection when given)
             output_dir: Directory to save transcription files
+            backend: "faster-whisper" (CTranslate2, int8) or "whisper" (openai-whisper)
+            model_size: Whisper model size, e.g. "tiny", "base", "small"
+            word_timestamps: Also align word-level timestamps (an extra pass per segment)
+            vad_filter: Skip silent regions with Silero VAD (for the "whisper" backend
+                this uses faster-whisper's VAD and is skipped if it is not installed)
+            audio: Pre-decoded 16 kHz mono samples (see _extract_audio_16k); when
+                given, Whisper does not decode video_path itself
+            quality: "draft", "balanced" or "accurate"; picks the model from
+                QUALITY_MODELS for the backend and overrides model_size
             
         Returns:
             Tuple of (transcription_text, timestamped_segments)
         """
-        try:
-            import whisper
-        except ImportError:
-            raise ImportError("Whisper not installed. Install with: pip install openai-whisper")
+        source = video_path if audio is None else audio
+        if quality is not None:
+            model_size = self._quality_model(backend, quality)
         
-        os.makedirs(output_dir, exist_ok=True)
+        if backend == "faster-whisper":
+            text, segments = self._transcribe_faster_whisper(
+                source, language, model_size, word_timestamps, vad_filter
+            )
+        elif backend == "whisper":
+            text, segments = self._transcribe_openai_whisper(
+                source, language, model_size, word_timestamps, vad_filter
+            )
+        else:
+            raise ValueError(f"Unknown transcription backend: {backend}")
         
-        # Load Whisper model
-        model = whisper.load_model("base")
+        self._save_transcription(video_path, output_dir, text, segments)
+        return text, segments
+    
+    def transcribe_audio_batch(self, video_paths: List[str], language: str = None,
+                               output_dir: str = "transcriptions",
+                               model_size: str = "base",
+                               batch_size: int = 16,
+                               word_timestamps: bool = False,
+                               vad_filter: bool = True,
+                               quality: Optional[Literal["draft", "balanced", "accurate"]] = None
+                               ) -> Dict[str, Tuple[str, List[Dict]]]:
+        """
+        Transcribe several videos together with faster-whisper's batched inference pipeline.
         
-        # Transcribe with timestamps
-        result = model.transcribe(video_path, language=language, word_timestamps=True)
+        The videos' audio is decoded to 16 kHz and laid end to end, and each video
+        contributes its own clips (at most 30 s, VAD-trimmed when vad_filter is set)
+        to a single clip list. Chunks from different videos are therefore decoded
+        batch_size at a time, so short clips are batched with each other instead
+        of each making a batch of one.
+        
+        Args:
+            video_paths: Paths to the video files
+            language: Language code for transcription; when None, one language is
+                detected for the whole batch from its first clip
+            output_dir: Directory to save transcription files
+            model_size: Whisper model size, e.g. "tiny", "base", "small"
+            batch_size: Number of audio chunks decoded together
+            word_timestamps: Also align word-level timestamps
+            vad_filter: Skip silent regions with Silero VAD
+            quality: "draft", "balanced" or "accurate"; overrides model_size
+            
+        Returns:
+            Dictionary mapping each video path to (transcription_text, timestamped_segments)
+        """
+        if quality is not None:
+            model_size = self._quality_model("faster-whisper", quality)
+        model = self._faster_whisper_model(model_size)
+        import faster_whisper
+        from faster_whisper.vad import VadOptions, get_speech_timestamps
+        
+        # Before 1.2 the pipeline read clip_timestamps as sample indices, not seconds
+        if tuple(int(part) for part in faster_whisper.__version__.split(".")[:2]) < (1, 2):
+            raise ImportError("transcribe_audio_batch needs faster-whisper >= 1.2. "
+                              "Upgrade with: pip install -U faster-whisper")
+        
+        chunk_length = model.feature_extractor.chunk_length
+        sampling_rate = model.feature_extractor.sampling_rate
+        chunk_samples = chunk_length * sampling_rate
+        hop = model.feature_extractor.hop_length
+        vad_options = VadOptions(**VAD_PARAMETERS, max_speech_duration_s=chunk_length)
+        
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            audios = list(executor.map(self._extract_audio_16k, video_paths))
+        
+        # Each video starts on a feature frame and is followed by at least one
+        # frame of padding, so the seek (start frame) of a segment's chunk tells
+        # which video it came from despite rounding
+        pieces, clips, offsets = [], [], []
+        offset = 0
+        for audio in audios:
+            if vad_filter:
+                # Speech spans are at most chunk_length long; join neighbours
+                # (and the silence between them) while they fit in one chunk
+                video_clips = []
+                for span in get_speech_timestamps(audio, vad_options):
+                    if video_clips and span["end"] - video_clips[-1]["start"] <= chunk_samples:
+                        video_clips[-1]["end"] = span["end"]
+                    else:
+                        video_clips.append({"start": span["start"], "end": span["end"]})
+            else:
+                video_clips = [{"start": start, "end": start + chunk_samples}
+                               for start in range(0, len(audio), chunk_samples)]
+            clips += [
+                {"start": offset + clip["start"], "end": offset + min(clip["end"], len(audio))}
+                for clip in video_clips if clip["end"] > clip["start"]
+            ]
+            offsets.append(offset)
+            
+            padded = (-(-len(audio) // hop) + 1) * hop
+            pieces += [audio, np.zeros(padded - len(audio), dtype=np.float32)]
+            offset += padded
+        del audios
+        
+        segments = []
+        if clips:
+            pipeline = faster_whisper.BatchedInferencePipeline(model=model)
+            # clip_timestamps (in seconds) replaces the pipeline's own VAD pass over
+            # the joined audio; the seconds round back to at most one sample earlier,
+            # still inside the frame margin the seek split below allows for
+            segments, _ = pipeline.transcribe(
+                np.concatenate(pieces), language=language, word_timestamps=word_timestamps,
+                batch_size=batch_size, vad_filter=False,
+                clip_timestamps=[
+                    {"start": clip["start"] / sampling_rate, "end": clip["end"] / sampling_rate}
+                    for clip in clips
+                ]
+            )
+            segments = self._segments_to_dicts(segments)
+        del pieces
+        
+        # Split the segments back per video and make their times relative to it
+        start_frames = np.array(offsets) // hop
+        video_segments = [[] for _ in video_paths]
+        for segment in segments:
+            index = int(np.searchsorted(start_frames - 1, segment["seek"], side="right")) - 1
+            shift = offsets[index] / sampling_rate
+            segment["id"] = len(video_segments[index]) + 1
+            segment["seek"] -= int(start_frames[index])
+            segment["start"] = round(float(segment["start"]) - shift, 3)
+            segment["end"] = round(float(segment["end"]) - shift, 3)
+            for word in segment["words"]:
+                word["start"] = round(float(word["start"]) - shift, 3)
+                word["end"] = round(float(word["end"]) - shift, 3)
+            video_segments[index].append(segment)
+        
+        results = {}
+        for video_path, segments in zip(video_paths, video_segments):
+            text = "".join(segment["text"] for segment in segments)
+            self._save_transcription(video_path, output_dir, text, segments)
+            results[video_path] = (text, segments)
+        
+        return results
+    
+    @staticmethod
+    def _quality_model(backend: str, quality: str) -> str:
+        """Return the Whisper model name for a transcription quality on backend."""
+        if quality not in QUALITY_MODELS:
+            raise ValueError(f"Unknown transcription quality: {quality}")
+        if backend not in QUALITY_MODELS[quality]:
+            raise ValueError(f"Unknown transcription backend: {backend}")
+        return QUALITY_MODELS[quality][backend]
+    
+    def _save_transcription(self, video_path: str, output_dir: str, text: str, segments: List[Dict]) -> None:
+        """Save the transcription text and timestamped segments for a video."""
+        os.makedirs(output_dir, exist_ok=True)
         
         # Save transcription files
         base_name = Path(video_path).stem
         transcription_path = os.path.join(output_dir, f"{base_name}.txt")
         
         with open(transcription_path, 'w', encoding='utf-8') as f:
-            f.write(result["text"])
+            f.write(text)
         
         # Save timestamped segments
         segments_path = os.path.join(output_dir, f"{base_name}_segments.json")
         with open(segments_path, 'w', encoding='utf-8') as f:
-            json.dump(result["segments"], f, indent=2, ensure_ascii=False)
+            json.dump(segments, f, indent=2, ensure_ascii=False)
+    
+    def _cached_whisper_model(self, key: Tuple, load: Callable[[], Any]) -> Any:
+        """Return the model cached under key, loading it on first use."""
+        with self._whisper_lock:
+            model = self._whisper_cache.get(key)
+            if model is None:
+                model = load()
+                self._whisper_cache[key] = model
+            return model
+    
+    def _transcribe_openai_whisper(self, video_path: Union[str, np.ndarray], language: str = None,
+                                   model_size: str = "base",
+                                   word_timestamps: bool = False,
+                                   vad_filter: bool = True) -> Tuple[str, List[Dict]]:
+        """
+        Transcribe with the reference openai-whisper implementation.
+        
+        With vad_filter, Silero VAD runs first and only the joined speech chunks
+        are transcribed; segment and word times are then mapped back onto the
+        original timeline.
+        """
+        try:
+            import whisper
+        except ImportError:
+            raise ImportError("Whisper not installed. Install with: pip install openai-whisper")
         
+        # Load Whisper model
+        model = self._cached_whisper_model(
+            ("whisper", model_size, None, None), lambda: whisper.load_model(model_size)
+        )
+        
+        audio = video_path
+        speech_map = None
+        if vad_filter:
+            try:
+                from faster_whisper.vad import SpeechTimestampsMap, VadOptions, get_speech_timestamps
+            except ImportError:
+                # VAD only saves work; transcribe the full audio without it
+                pass
+            else:
+                if not isinstance(audio, np.ndarray):
+                    audio = self._extract_audio_16k(video_path)
+                speech_chunks = get_speech_timestamps(audio, VadOptions(**VAD_PARAMETERS))
+                if not speech_chunks:
+                    return "", []
+                audio = np.concatenate([audio[chunk["start"]:chunk["end"]] for chunk in speech_chunks])
+                speech_map = SpeechTimestampsMap(speech_chunks, 16000)
+        
+        # Transcribe with timestamps
+        result = model.transcribe(audio, language=language, word_timestamps=word_timestamps)
+        if speech_map is not None:
+            self._restore_speech_timestamps(result["segments"], speech_map)
         return result["text"], result["segments"]
     
+    @staticmethod
+    def _restore_speech_timestamps(segments: List[Dict], speech_map: Any) -> None:
+        """Map segment and word times from VAD-trimmed audio back onto the original timeline."""
+        for segment in segments:
+            words = segment.get("words") or []
+            for word in words:
+                # Resolve both ends of a word to the same speech chunk
+                chunk_index = speech_map.get_chunk_index((word["start"] + word["end"]) / 2)
+                word["start"] = speech_map.get_original_time(word["start"], chunk_index)
+                word["end"] = speech_map.get_original_time(word["end"], chunk_index)
+            
+            if words:
+                segment["start"], segment["end"] = words[0]["start"], words[-1]["end"]
+            else:
+                # A segment may span chunks; an end exactly on a chunk boundary
+                # belongs to the chunk it closes, hence the one-sample step back
+                end_index = speech_map.get_chunk_index(max(segment["start"], segment["end"] - 1 / 16000))
+                segment["start"] = speech_map.get_original_time(segment["start"])
+                segment["end"] = speech_map.get_original_time(segment["end"], end_index)
+    
+    def _faster_whisper_model(self, model_size: str = "base") -> Any:
+        """Return the cached faster-whisper model for model_size on the best available device."""
+        try:
+            from faster_whisper import WhisperModel
+            import ctranslate2
+        except ImportError:
+            raise ImportError("faster-whisper not installed. Install with: pip install faster-whisper "
+                              "(or pass backend=\"whisper\")")
+        
+        # int8 weights, fp16 activations on GPU
+        if ctranslate2.get_cuda_device_count() > 0:
+            device, compute_type = "cuda", "int8_float16"
+        else:
+            device, compute_type = "cpu", "int8"
+        return self._cached_whisper_model(
+            ("faster-whisper", model_size, device, compute_type),
+            lambda: WhisperModel(model_size, device=device, compute_type=compute_type)
+        )
+    
+    def _transcribe_faster_whisper(self, video_path: Union[str, np.ndarray], language: str = None,
+                                   model_size: str = "base",
+                                   word_timestamps: bool = False,
+                                   vad_filter: bool = True) -> Tuple[str, List[Dict]]:
+        """Transcribe with faster-whisper, returning segments in openai-whisper's dict shape."""
+        model = self._faster_whisper_model(model_size)
+        
+        segments, _ = model.transcribe(
+            video_path, language=language, word_timestamps=word_timestamps, beam_size=5,
+            vad_filter=vad_filter, vad_parameters=VAD_PARAMETERS if vad_filter else None
+        )
+        segment_dicts = self._segments_to_dicts(segments)
+        
+        text = "".join(segment["text"] for segment in segment_dicts)
+        return text, segment_dicts
+    
+    @staticmethod
+    def _segments_to_dicts(segments) -> List[Dict]:
+        """Materialize faster-whisper's lazy segment generator into openai-whisper style dicts."""
+        segment_dicts = []
+        for segment in segments:
+            segment_dicts.append({
+                "id": segment.id,
+                "seek": segment.seek,
+                "start": segment.start,
+                "end": segment.end,
+                "text": segment.text,
+                "tokens": segment.tokens,
+                "temperature": segment.temperature,
+                "avg_logprob": segment.avg_logprob,
+                "compression_ratio": segment.compression_ratio,
+                "no_speech_prob": segment.no_speech_prob,
+                "words": [
+                    {"word": w.word, "start": w.start, "end": w.end, "probability": w.probability}
+                    for w in (segment.words or [])
+                ]
+            })
+        return segment_dicts
+    
     def search_video_content(self, video_path: str, 
                            search_type: str = "all",
                            **kwargs) -> Dict:
@@ -242,8 +946,11 @@ class FFmpegVideoProcessor:
         Returns:
             Dictionary containing analysis results
         """
-        if not os.path.exists(video_path):
-            raise FileNotFoundError(f"Video file not found: {video_path}")
+        # A single stat both checks existence and gives get_video_metadata the size
+        try:
+            stat = os.stat(video_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Video file not found: {video_path}") from None
         
         results = {
             "video_path": video_path,
@@ -252,27 +959,50 @@ class FFmpegVideoProcessor:
         }
         
         try:
-            if search_type in ["metadata", "all"]:
-                results["results"]["metadata"] = self.get_video_metadata(video_path)
-            
-            if search_type in ["scenes", "all"]:
+            # The analyses are independent ffprobe/ffmpeg/Whisper jobs, so run them concurrently
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                futures = {}
+                
+                if search_type in ["metadata", "all"]:
+                    futures["metadata"] = executor.submit(self.get_video_metadata, video_path, stat)
+                
                 threshold = kwargs.get("scene_threshold", 0.3)
-                results["results"]["scene_changes"] = self.detect_scene_changes(video_path, threshold)
+                fps = kwargs.get("frame_fps", 2)
+                output_dir = kwargs.get("frames_output_dir", "frames")
+                
+                if search_type == "all" and kwargs.get("extract_frames", False):
+                    # Both need a full decode, so share a single FFmpeg pass
+                    futures["frames_and_scenes"] = executor.submit(
+                        self.extract_and_detect, video_path, threshold, fps, output_dir
+                    )
+                else:
+                    if search_type in ["scenes", "all"]:
+                        futures["scene_changes"] = executor.submit(self.detect_scene_changes, video_path, threshold)
+                    
+                    if search_type in ["frames", "all"]:
+                        if kwargs.get("extract_frames", False):
+                            futures["frames"] = executor.submit(self.extract_frames, video_path, fps, output_dir)
+                
+                if search_type in ["transcription", "all"]:
+                    if kwargs.get("transcribe", False):
+                        futures["transcription"] = executor.submit(
+                            self._transcribe_for_search, video_path, kwargs
+                        )
+                
+                for name, future in futures.items():
+                    results["results"][name] = future.result()
             
-            if search_type in ["frames", "all"]:
-                if kwargs.get("extract_frames", False):
-                    fps = kwargs.get("frame_fps", 2)
-                    output_dir = kwargs.get("frames_output_dir", "frames")
-                    results["results"]["frames"] = self.extract_frames(video_path, fps, output_dir)
+            if "frames_and_scenes" in results["results"]:
+                frames_dir, scene_changes = results["results"].pop("frames_and_scenes")
+                results["results"]["scene_changes"] = scene_changes
+                results["results"]["frames"] = frames_dir
             
-            if search_type in ["transcription", "all"]:
-                if kwargs.get("transcribe", False):
-                    language = kwargs.get("language", None)
-                    text, segments = self.transcribe_audio(video_path, language)
-                    results["results"]["transcription"] = {
-                        "text": text,
-                        "segments": segments
-                    }
+            if "transcription" in results["results"]:
+                text, segments = results["results"]["transcription"]
+                results["results"]["transcription"] = {
+                    "text": text,
+                    "segments": segments
+                }
             
             results["status"] = "success"
             
@@ -281,6 +1011,29 @@ class FFmpegVideoProcessor:
             results["error"] = str(e)
         
         return results
+    
+    def _transcribe_for_search(self, video_path: str, kwargs: Dict) -> Tuple[str, List[Dict]]:
+        """Run the transcription step of search_video_content."""
+        backend = kwargs.get("backend", "faster-whisper")
+        audio = None
+        if backend == "whisper":
+            # openai-whisper decodes by running whatever `ffmpeg` is on PATH; decode
+            # here instead (still one ffmpeg run) so this processor's ffmpeg_path is
+            # used. faster-whisper decodes in-process with PyAV, so it gets the path
+            audio = self._extract_audio_16k(video_path)
+        
+        return self.transcribe_audio(
+            video_path, kwargs.get("language", None),
+            backend=backend,
+            word_timestamps=kwargs.get("word_timestamps", False),
+            model_size=kwargs.get("model_size", "base"),
+            quality=kwargs.get("quality", None),
+            audio=audio
+        )
+
+
+# Shared by ffmpeg_video_search calls so its Whisper models and probes are reused
+_default_processor: Optional[FFmpegVideoProcessor] = None
 
 
 # Convenience function similar to duckduckgo_search
@@ -298,8 +1051,10 @@ def ffmpeg_video_search(video_path: str,
     Returns:
         Dictionary containing analysis results
     """
-    processor = FFmpegVideoProcessor()
-    return processor.search_video_content(video_path, search_type, **kwargs)
+    global _default_processor
+    if _default_processor is None:
+        _default_processor = FFmpegVideoProcessor()
+    return _default_processor.search_video_content(video_path, search_type, **kwargs)
 
 
 # Example usage and demonstration